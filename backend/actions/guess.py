@@ -1,23 +1,15 @@
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set
 
-from backend.utils.scoring import describe_hotness, compute_percentile
+import numpy as np
 
+from backend.utils.scoring import describe_hotness
 
-def make_guess(
-    guess_word: str,
-    target_word: str,
-    target_similarity_list: List[Tuple[str, float]],
-    target_pos_map: Dict[str, int],
-    target_total: int,
-    vocab_set: Set[str],
-    offsets: Dict[str, int],
-) -> Dict[str, Optional[object]]:
-    guess_norm = (guess_word or "").strip().lower()
 
-    base_response: Dict[str, Optional[object]] = {
+def _error(guess_norm: str, message: str) -> Dict[str, Optional[object]]:
+    return {
         "guess": guess_norm,
         "valid": False,
-        "error": None,
+        "error": message,
         "is_correct": None,
         "rank": None,
         "total": None,
@@ -26,72 +18,135 @@ def make_guess(
         "hotness": None,
     }
 
+
+def make_guess(
+    guess_word: str,
+    target_word: str,
+    target_sims: np.ndarray,
+    target_pos_map: Dict[str, int],
+    target_total: int,
+    target_percentiles: np.ndarray,
+    target_hotness: np.ndarray,
+    vocab_set: Set[str],
+    sim_vocab: Dict[str, object],
+) -> Dict[str, Optional[object]]:
+    guess_norm = (guess_word or "").strip().lower()
+
     if not guess_norm:
-        base_response["error"] = "Empty guess."
-        return base_response
+        return _error(guess_norm, "Empty guess.")
 
     if guess_norm not in vocab_set:
-        base_response["error"] = "Word is not in the allowed vocabulary."
-        return base_response
-
-    if guess_norm not in offsets:
-        base_response["error"] = "Word is missing from similarity data."
-        return base_response
+        return _error(guess_norm, "Word is not in the allowed vocabulary.")
 
-    base_response["valid"] = True
+    if guess_norm not in sim_vocab:
+        return _error(guess_norm, "Word is missing from similarity data.")
 
     # Correct guess case
     if guess_norm == target_word:
-        sim = 1.0
-        rank = 1
-        percentile = 100.0
-        hotness = describe_hotness(rank, target_total)
+        return {
+            "guess": guess_norm,
+            "valid": True,
+            "error": None,
+            "is_correct": True,
+            "rank": 1,
+            "total": target_total,
+            "similarity": 1.0,
+            "percentile": 100.0,
+            "hotness": describe_hotness(1, target_total),
+        }
 
-        base_response.update(
-            {
+    # In-vocab, not equal to target: find its rank & similarity.
+    # target_pos_map covers the entire similarity list (set_target
+    # guarantees this), so a miss here means the data is inconsistent —
+    # error out instead of falling back to a linear scan.
+    idx = target_pos_map.get(guess_norm)
+    if idx is None:
+        return _error(
+            guess_norm,
+            "Internal error: guess not found in target similarity list.",
+        )
+
+    # Each response is a single dict literal — no template allocation
+    # followed by update() on the hot path. Percentile & hotness are
+    # rank-based, precomputed per target.
+    return {
+        "guess": guess_norm,
+        "valid": True,
+        "error": None,
+        "is_correct": False,
+        "rank": idx + 1,
+        "total": target_total,
+        "similarity": float(target_sims[idx]),
+        "percentile": float(target_percentiles[idx]),
+        "hotness": target_hotness[idx],
+    }
+
+
+def make_guess_batch(
+    guess_words: Sequence[str],
+    target_word: str,
+    target_sims: np.ndarray,
+    target_pos_map: Dict[str, int],
+    target_total: int,
+    target_percentiles: np.ndarray,
+    target_hotness: np.ndarray,
+    vocab_set: Set[str],
+    sim_vocab: Dict[str, object],
+) -> List[Dict[str, Optional[object]]]:
+    """
+    Score many guesses in one pass. Ranks are resolved for all guesses
+    up front and similarity/percentile come from a single vectorized
+    gather, so the per-guess cost is just validation and dict assembly.
+    """
+    norms = [(w or "").strip().lower() for w in guess_words]
+
+    idxs = np.fromiter(
+        (target_pos_map.get(w, -1) for w in norms),
+        dtype=np.int32,
+        count=len(norms),
+    )
+    safe = idxs.clip(min=0)
+    sims = target_sims[safe] if len(target_sims) else safe
+    percentiles = target_percentiles[safe] if len(target_percentiles) else safe
+
+    responses: List[Dict[str, Optional[object]]] = []
+    for i, guess_norm in enumerate(norms):
+        if not guess_norm:
+            response = _error(guess_norm, "Empty guess.")
+        elif guess_norm not in vocab_set:
+            response = _error(guess_norm, "Word is not in the allowed vocabulary.")
+        elif guess_norm not in sim_vocab:
+            response = _error(guess_norm, "Word is missing from similarity data.")
+        elif guess_norm == target_word:
+            response = {
+                "guess": guess_norm,
+                "valid": True,
+                "error": None,
                 "is_correct": True,
-                "rank": rank,
+                "rank": 1,
                 "total": target_total,
-                "similarity": sim,
-                "percentile": percentile,
-                "hotness": hotness,
+                "similarity": 1.0,
+                "percentile": 100.0,
+                "hotness": describe_hotness(1, target_total),
             }
-        )
-        return base_response
-
-    # In-vocab, not equal to target: find its rank & similarity
-    if guess_norm in target_pos_map:
-        idx = target_pos_map[guess_norm]
-        rank = idx + 1
-        sim = target_similarity_list[idx][1]
-    else:
-        idx = None
-        sim = None
-        for j, (w, sc) in enumerate(target_similarity_list):
-            if w == guess_norm:
-                idx = j
-                sim = sc
-                break
-        if idx is None or sim is None:
-            base_response["error"] = (
-                "Internal error: guess not found in target similarity list."
+        elif idxs[i] < 0:
+            response = _error(
+                guess_norm,
+                "Internal error: guess not found in target similarity list.",
             )
-            base_response["valid"] = False
-            return base_response
-        rank = idx + 1
-
-    # Percentile & hotness are now rank-based
-    percentile = compute_percentile(rank, target_total)
-    hotness = describe_hotness(rank, target_total)
-
-    base_response.update(
-        {
-            "is_correct": False,
-            "rank": rank,
-            "total": target_total,
-            "similarity": sim,
-            "percentile": percentile,
-            "hotness": hotness,
-        }
-    )
-    return base_response
+        else:
+            response = {
+                "guess": guess_norm,
+                "valid": True,
+                "error": None,
+                "is_correct": False,
+                "rank": int(idxs[i]) + 1,
+                "total": target_total,
+                "similarity": float(sims[i]),
+                "percentile": float(percentiles[i]),
+                "hotness": target_hotness[int(idxs[i])],
+            }
+
+        responses.append(response)
+
+    return responses
@@ -13,19 +13,62 @@ Run locally:
   uvicorn api:app --host 0.0.0.0 --port 8000
 """
 
+import logging
+import os
 import traceback
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+# Logging is configured once at the app entry point; modules just use
+# logging.getLogger(__name__) and inherit the level set here.
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "INFO").upper())
+
+from backend import cache
 from backend.config import CORS_ORIGINS
 from backend.game import WordGameEngine
 from backend.routes import guess, health, similar_word, hint, quit
 
+
+# The engine is constructed at import time so that, under gunicorn with
+# preload_app, it is built exactly once in the pre-fork master and the
+# workers inherit it copy-on-write — one secret word for every worker.
+# Constructing it in the lifespan (which runs post-fork, per worker)
+# would give each worker its own random target and break any game whose
+# requests land on different workers.
+try:
+    print("[startup] Initializing WordGameEngine...")
+    _engine = WordGameEngine()
+    print("[startup] WordGameEngine initialized successfully!")
+    print(f"[startup] Target word set to: {_engine.get_target()}")
+    print(
+        f"[startup] Target similarity list length: {len(_engine.target_words)}"
+    )
+except Exception as e:
+    _engine = None
+    print(f"[startup] Failed to initialize WordGameEngine: {e}")
+    print("[startup] Full traceback:")
+    traceback.print_exc()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await cache.connect()
+    app.state.engine = _engine
+    yield
+    await cache.close()
+
+
 app = FastAPI(
     title="Word Hot-Cold Game API",
     version="1.1.0",
     description="API to get the rank of a guessed word relative to a hidden target word.",
+    lifespan=lifespan,
+    # orjson serializes the small response dicts several times faster
+    # than the stdlib json encoder.
+    default_response_class=ORJSONResponse,
 )
 
 # ---- CORS (adjust origins for your GitHub Pages) ----
@@ -45,25 +88,8 @@ app.include_router(hint.router)
 app.include_router(quit.router)
 
 
-@app.on_event("startup")
-def startup_event() -> None:
-    try:
-        print("[startup] Initializing WordGameEngine...")
-        app.state.engine = WordGameEngine()
-        print("[startup] WordGameEngine initialized successfully!")
-        print(f"[startup] Target word set to: {app.state.engine.get_target()}")
-        print(
-            f"[startup] Target similarity list length: {len(app.state.engine.target_similarity_list)}"
-        )
-    except Exception as e:
-        app.state.engine = None
-        print(f"[startup] Failed to initialize WordGameEngine: {e}")
-        print("[startup] Full traceback:")
-        traceback.print_exc()
-
-
 @app.get("/")
-def root():
+async def root():
     return {
         "message": "Word Hot-Cold Game API",
         "endpoints": ["/health", "/guess", "/similar_word", "/quit", "/docs"],
@@ -0,0 +1,67 @@
+"""
+Optional Redis-backed response cache shared across workers.
+
+Enabled when the REDIS_URL environment variable is set and the redis
+package is installed; otherwise every helper is a no-op and workers
+fall back to their in-process memo. Keys embed the target word, so a
+target rotation never serves stale entries — old keys simply expire.
+"""
+
+import json
+import logging
+import os
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+GUESS_TTL_SECONDS = 3600
+
+_client = None
+
+
+async def connect() -> None:
+    global _client
+    url = os.environ.get("REDIS_URL")
+    if not url:
+        return
+    if aioredis is None:
+        logger.warning("REDIS_URL is set but the redis package is not installed.")
+        return
+    _client = aioredis.from_url(url)
+    logger.info("Connected response cache to Redis.")
+
+
+async def close() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def guess_key(target_word: str, guess_word: str) -> str:
+    return f"g:{target_word}:{(guess_word or '').strip().lower()}"
+
+
+async def get_json(key: str) -> Optional[dict]:
+    if _client is None:
+        return None
+    try:
+        raw = await _client.get(key)
+    except Exception as e:
+        logger.warning("Redis get failed: %s", e)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+async def set_json(key: str, value: dict, ttl: int = GUESS_TTL_SECONDS) -> None:
+    if _client is None:
+        return
+    try:
+        await _client.setex(key, ttl, json.dumps(value))
+    except Exception as e:
+        logger.warning("Redis set failed: %s", e)
@@ -1,5 +1,8 @@
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 # Get the directory where this config file is located (backend/)
 BACKEND_DIR = Path(__file__).resolve().parent
 # Go up one level to get project root
@@ -10,14 +13,21 @@ DATA_DIR = BASE_DIR / "data"
 SIMILARITY_PATH = DATA_DIR / "similarity.txt"
 NOUNS_PATH = DATA_DIR / "common_nouns.txt"
 
-# Debug logging
-print(f"[config] BACKEND_DIR: {BACKEND_DIR}")
-print(f"[config] BASE_DIR: {BASE_DIR}")
-print(f"[config] DATA_DIR: {DATA_DIR}")
-print(f"[config] SIMILARITY_PATH: {SIMILARITY_PATH}")
-print(f"[config] NOUNS_PATH: {NOUNS_PATH}")
-print(f"[config] Similarity file exists: {SIMILARITY_PATH.exists()}")
-print(f"[config] Nouns file exists: {NOUNS_PATH.exists()}")
+# Binary similarity data (built from similarity.txt by
+# backend/scripts/build_similarity_bin.py; optional, text is the fallback)
+SIMILARITY_BIN_PATH = DATA_DIR / "similarity.bin"
+SIMILARITY_INDEX_PATH = DATA_DIR / "similarity_index.npz"
+
+# Debug logging — lazy so imports don't write to stderr (or stat the
+# data files) unless DEBUG logging is actually enabled.
+logger.debug("BACKEND_DIR: %s", BACKEND_DIR)
+logger.debug("BASE_DIR: %s", BASE_DIR)
+logger.debug("DATA_DIR: %s", DATA_DIR)
+logger.debug("SIMILARITY_PATH: %s", SIMILARITY_PATH)
+logger.debug("NOUNS_PATH: %s", NOUNS_PATH)
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug("Similarity file exists: %s", SIMILARITY_PATH.exists())
+    logger.debug("Nouns file exists: %s", NOUNS_PATH.exists())
 
 CORS_ORIGINS = [
     "https://sagnik31.github.io",
@@ -1,15 +1,34 @@
 import logging
 import random
+import sys
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from backend.actions.guess import make_guess
+import numpy as np
+
+from backend.actions.guess import make_guess, make_guess_batch
 from backend.actions.similar_word import get_similar_word
 from backend.actions.hint import get_hint  # if you still use this elsewhere
-from backend.config import NOUNS_PATH, SIMILARITY_PATH
-from backend.utils.loaders import build_line_index, load_vocab, read_similarity_row
-
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+from backend.config import (
+    NOUNS_PATH,
+    SIMILARITY_BIN_PATH,
+    SIMILARITY_INDEX_PATH,
+    SIMILARITY_PATH,
+)
+from backend.utils.loaders import (
+    SIM_SCORE_SCALE,
+    advise_row_willneed,
+    build_line_index_mm,
+    load_similarity_index,
+    load_vocab,
+    open_similarity_bin,
+    open_similarity_text,
+    read_similarity_row_mm,
+)
+from backend.utils.scoring import describe_hotness_batch
+
+logger = logging.getLogger(__name__)
 
 
 class WordGameEngine:
@@ -17,6 +36,14 @@ class WordGameEngine:
     Engine for the hot-and-cold word guessing game.
     """
 
+    # Upper bound on memoized guess responses per target (safety valve;
+    # the vocabulary is far smaller than this in practice).
+    GUESS_CACHE_MAX = 65536
+
+    # Recently loaded similarity rows kept as ready-to-use arrays, so
+    # rotating back to a recent target skips the read/dequantize work.
+    ROW_CACHE_MAX = 512
+
     def __init__(
         self,
         similarity_path: str = str(SIMILARITY_PATH),
@@ -26,13 +53,24 @@ class WordGameEngine:
         self.similarity_path = Path(similarity_path)
         self.nouns_path = Path(nouns_path)
 
-        print(f"[WordGameEngine]   similarity_path: {self.similarity_path}")
-        print(f"[WordGameEngine]   nouns_path: {self.nouns_path}")
-        print(
-            f"[WordGameEngine]   Files exist: similarity={self.similarity_path.exists()}, nouns={self.nouns_path.exists()}"
+        # Engine-local RNG: module-level random serializes concurrent
+        # callers on the shared Random instance's internal state.
+        self._rng = random.Random()
+
+        logger.debug("similarity_path: %s", self.similarity_path)
+        logger.debug("nouns_path: %s", self.nouns_path)
+
+        # The binary similarity data is optional and only ever holds the
+        # default similarity file, so take the fast path just when no
+        # override was given; an explicit similarity_path is honored via
+        # the text loader. The text file is required only when it is the
+        # source we will actually read.
+        self._use_binary = (
+            self.similarity_path == Path(str(SIMILARITY_PATH))
+            and SIMILARITY_BIN_PATH.exists()
+            and SIMILARITY_INDEX_PATH.exists()
         )
-
-        if not self.similarity_path.exists():
+        if not self._use_binary and not self.similarity_path.exists():
             raise FileNotFoundError(
                 f"similarity file not found: {self.similarity_path}"
             )
@@ -40,63 +78,196 @@ class WordGameEngine:
             raise FileNotFoundError(f"nouns file not found: {self.nouns_path}")
 
         self.vocab: List[str] = load_vocab(str(self.nouns_path))
-        self.vocab_set = set(self.vocab)
-        print(f"[WordGameEngine] Loaded {len(self.vocab)} vocabulary words")
-        if len(self.vocab) > 0:
-            print(f"[WordGameEngine] First few words: {self.vocab[:10]}")
-
-        self.offsets: Dict[str, int] = build_line_index(str(self.similarity_path))
-        print(
-            f"[WordGameEngine] Built index for {len(self.offsets)} words in similarity file"
-        )
+        # Interned + frozen: membership tests in make_guess compare
+        # pointers on a hit, and the set itself is immutable.
+        self.vocab_set = frozenset(sys.intern(w) for w in self.vocab)
+        logger.debug("Loaded %d vocabulary words", len(self.vocab))
+
+        self.offsets: Dict[str, int] = {}
+        self.row_index: Dict[str, Tuple[int, int]] = {}
+        self.id2word: Optional[np.ndarray] = None
+        self._sim_records: Optional[np.ndarray] = None
+
+        if self._use_binary:
+            # mmap'd fixed-width records: rows are zero-parse slices.
+            self.id2word, self.row_index = load_similarity_index(
+                str(SIMILARITY_INDEX_PATH)
+            )
+            self._sim_records = open_similarity_bin(str(SIMILARITY_BIN_PATH))
+            self.sim_vocab = self.row_index
+            logger.debug(
+                "Using binary similarity data with %d rows", len(self.row_index)
+            )
+            self._valid_targets: List[str] = [
+                word for word, (_, count) in self.row_index.items() if count > 0
+            ]
+        else:
+            # The mapping stays alive on the engine: index building and
+            # row reads are zero-copy byte slices of the same page-cache
+            # pages, shared with any other worker mapping the file.
+            self._sim_mmap = open_similarity_text(str(self.similarity_path))
+            self.offsets = build_line_index_mm(self._sim_mmap)
+            self.sim_vocab = self.offsets
+            logger.debug(
+                "Built index for %d words in similarity file", len(self.offsets)
+            )
 
-        vocab_in_similarity = set(self.offsets.keys())
-        if not vocab_in_similarity:
+            # Pre-filter targets with a non-empty similarity row using byte
+            # lengths derived from consecutive offsets — an empty row is just
+            # "word\t\n", so anything longer has at least one neighbor. This
+            # avoids reading rows from disk just to reject them in set_target.
+            file_size = self.similarity_path.stat().st_size
+            by_offset = sorted(self.offsets.items(), key=lambda kv: kv[1])
+            ends = [off for _, off in by_offset[1:]] + [file_size]
+            self._valid_targets = [
+                word
+                for (word, off), end in zip(by_offset, ends)
+                if end - off > len(word) + 2
+            ]
+
+        if not self.sim_vocab:
             raise RuntimeError("No words found in similarity file.")
+        logger.debug(
+            "%d candidate targets with non-empty rows", len(self._valid_targets)
+        )
 
-        # Target-related data
+        # Target-related data, stored as parallel arrays (structure of
+        # arrays): target_words[i] is the word at rank i+1 and
+        # target_sims[i] its similarity to the target.
         self.target_word: str = ""
-        self.target_similarity_list: List[Tuple[str, float]] = []
+        self.target_words: np.ndarray = np.empty(0, dtype=object)
+        self.target_sims: np.ndarray = np.empty(0, dtype=np.float32)
         self.target_pos_map: Dict[str, int] = {}
         self.target_total: int = 0
 
+        # Per-rank lookup tables, precomputed once per target so each
+        # guess/hint is an array index instead of arithmetic + branching.
+        self.target_percentiles: np.ndarray = np.empty(0, dtype=np.float32)
+        self.target_hotness: np.ndarray = np.empty(0, dtype=object)
+
+        # Ascending copy of target_sims for O(log N) score -> percentile
+        # queries via binary search.
+        self._sorted_sims: np.ndarray = np.empty(0, dtype=np.float32)
+
         # Game state: best rank across guesses + hints, and number of hints
         self.best_rank_overall: Optional[int] = None
         self.hint_count: int = 0
 
+        # Guess responses are deterministic for a fixed target, so repeat
+        # guesses are served from this per-target memo.
+        self._guess_cache: Dict[str, Dict[str, Optional[object]]] = {}
+
+        # LRU of loaded rows, keyed by target word. lru_cache on a method
+        # would pin self, so this is a plain OrderedDict.
+        self._row_cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray]]" = (
+            OrderedDict()
+        )
+
         self.set_target(target_word)
-        print(
-            f"[WordGameEngine] Initialized successfully with target: {self.target_word}"
+        logger.debug(
+            "Initialized successfully with target: %s", self.target_word
         )
 
-    def set_target(self, target_word: Optional[str] = None) -> str:
-        available = list(self.offsets.keys())
+    def _read_row_arrays(
+        self, word: str
+    ) -> Tuple[np.ndarray, ...]:
+        """
+        Load a word's similarity row as parallel (words, sims) arrays
+        plus everything derived from it: the word -> rank-index map and
+        the per-rank percentile/hotness/sorted-sims tables. All of it
+        goes through a small LRU keyed by the row's word, so rotating
+        back to a recent target allocates nothing.
+        """
+        cached = self._row_cache.get(word)
+        if cached is not None:
+            self._row_cache.move_to_end(word)
+            return cached
+
+        words, sims = self._load_row_arrays(word)
+
+        # Rows can repeat a word (the vocab file splits multi-word
+        # names into tokens), so keep the first = best-ranked
+        # occurrence. make_guess relies on the map covering every word
+        # in the row.
+        pos_map: Dict[str, int] = {}
+        for idx, w in enumerate(words):
+            pos_map.setdefault(w, idx)
+
+        # Percentile/hotness are pure functions of rank for a fixed
+        # row, so tabulate them with the row: index i holds rank i+1.
+        total = len(words) + 1  # +1 for the target itself
+        total_others = max(1, total - 1)
+        percentiles = 100.0 * (
+            1.0 - np.arange(len(words), dtype=np.float32) / total_others
+        )
+        hotness = describe_hotness_batch(np.arange(1, len(words) + 1), total)
+        # Ascending copy for O(log N) score -> percentile queries.
+        sorted_sims = np.sort(sims)
+
+        entry = (words, sims, pos_map, percentiles, hotness, sorted_sims)
+        self._row_cache[word] = entry
+        if len(self._row_cache) > self.ROW_CACHE_MAX:
+            self._row_cache.popitem(last=False)
+        return entry
+
+    def _load_row_arrays(self, word: str) -> Tuple[np.ndarray, np.ndarray]:
+        if self._sim_records is not None:
+            start, count = self.row_index[word]
+            # Prefetch the row's pages; the mapping itself is advised
+            # MADV_RANDOM so cold neighbors aren't read ahead.
+            advise_row_willneed(self._sim_records, start, count)
+            row = self._sim_records[start : start + count]
+            words = self.id2word[row["id"]]
+            # Scores are stored quantized (int8); dequantize once here so
+            # everything downstream keeps working in float32.
+            sims = row["score"].astype(np.float32) / SIM_SCORE_SCALE
+            return words, sims
+
+        neighbors, sims = read_similarity_row_mm(
+            self._sim_mmap, self.offsets[word]
+        )
+        words = np.array(neighbors, dtype=object)
+        return words, sims
 
+    def set_target(self, target_word: Optional[str] = None) -> str:
         # If a specific target is requested, use it and validate once
         if target_word is not None:
             target_word = target_word.strip().lower()
-            if target_word not in self.offsets:
+            if target_word not in self.sim_vocab:
                 raise ValueError(
                     f"Requested target not in similarity data: {target_word}"
                 )
             candidates = [target_word]
         else:
-            candidates = available
+            candidates = self._valid_targets
 
-        for _ in range(len(candidates) * 3):  # some upper bound on attempts
-            chosen = random.choice(candidates)
-            offset = self.offsets[chosen]
-            sims = read_similarity_row(str(self.similarity_path), offset)
+        if not candidates:
+            raise RuntimeError(
+                "Could not find a target with a non-empty similarity list."
+            )
 
-            if sims:  # only accept targets with non-empty similarity list
+        # Candidates are pre-filtered, so one read is the expected case; a
+        # few retries guard against rows the length heuristic let through.
+        for _ in range(10):
+            chosen = self._rng.choice(candidates)
+            words, sims, pos_map, percentiles, hotness, sorted_sims = (
+                self._read_row_arrays(chosen)
+            )
+
+            if len(words):  # only accept targets with non-empty similarity list
                 self.target_word = chosen
-                self.target_similarity_list = sims
-                self.target_total = len(sims) + 1  # +1 for self
-                self.target_pos_map = {w: idx for idx, (w, _) in enumerate(sims)}
+                self.target_words = words
+                self.target_sims = sims
+                self.target_pos_map = pos_map
+                self.target_total = len(words) + 1  # +1 for self
+                self.target_percentiles = percentiles
+                self.target_hotness = hotness
+                self._sorted_sims = sorted_sims
 
                 # Reset game state when changing target
                 self.best_rank_overall = None
                 self.hint_count = 0
+                self._guess_cache = {}
 
                 return self.target_word
 
@@ -105,6 +276,16 @@ class WordGameEngine:
     def get_target(self) -> str:
         return self.target_word
 
+    def percentile_of_similarity(self, sim) -> np.ndarray:
+        """
+        Percentile of raw similarity score(s) against the current
+        target's distribution. Binary search over the presorted sims
+        array, so a whole array of queries is answered in one call.
+        """
+        n = len(self._sorted_sims)
+        pos = np.searchsorted(self._sorted_sims, sim, side="right")
+        return 100.0 * pos / max(1, n)
+
     def get_answer(self) -> str:
         """
         Return the current target word (for quit endpoint / debugging).
@@ -138,8 +319,11 @@ class WordGameEngine:
         """
         strength = self._determine_hint_strength()
         hint = get_similar_word(
-            self.target_similarity_list,
+            self.target_words,
+            self.target_sims,
             self.target_total,
+            self.target_percentiles,
+            self.target_hotness,
             self.best_rank_overall,
             strength,
         )
@@ -157,8 +341,11 @@ class WordGameEngine:
         """
        strength = self._determine_hint_strength()
        hint = get_hint(
-            self.target_similarity_list,
+            self.target_words,
+            self.target_sims,
             self.target_total,
+            self.target_percentiles,
+            self.target_hotness,
             self.best_rank_overall,
             strength,
         )
@@ -168,19 +355,58 @@ class WordGameEngine:
 
     # --- Guess handling -------------------------------------------------
 
+    def record_result(self, result: Dict[str, Optional[object]]) -> None:
+        """
+        Fold an externally cached guess result (e.g. a Redis hit that
+        bypassed make_guess) into game state, mirroring the best-rank
+        update a fresh guess would have applied.
+        """
+        if result.get("valid") and result.get("rank") is not None:
+            self._update_best_rank(result["rank"])
+
     def make_guess(self, guess_word: str) -> Dict[str, Optional[object]]:
-        result = make_guess(
-            guess_word,
+        guess_norm = (guess_word or "").strip().lower()
+
+        result = self._guess_cache.get(guess_norm)
+        if result is None:
+            result = make_guess(
+                guess_norm,
+                self.target_word,
+                self.target_sims,
+                self.target_pos_map,
+                self.target_total,
+                self.target_percentiles,
+                self.target_hotness,
+                self.vocab_set,
+                self.sim_vocab,
+            )
+            if len(self._guess_cache) < self.GUESS_CACHE_MAX:
+                self._guess_cache[guess_norm] = result
+
+        # Update best_rank_overall based on guess rank
+        if result.get("valid") and result.get("rank") is not None:
+            self._update_best_rank(result["rank"])
+
+        return result
+
+    def make_guesses(self, guess_words: List[str]) -> List[Dict[str, Optional[object]]]:
+        """
+        Score a batch of guesses in one vectorized pass.
+        """
+        results = make_guess_batch(
+            guess_words,
             self.target_word,
-            self.target_similarity_list,
+            self.target_sims,
             self.target_pos_map,
             self.target_total,
+            self.target_percentiles,
+            self.target_hotness,
             self.vocab_set,
-            self.offsets,
+            self.sim_vocab,
         )
 
-        # Update best_rank_overall based on guess rank
-        if result.get("valid") and result.get("rank") is not None:
-            self._update_best_rank(result["rank"])
+        for result in results:
+            if result.get("valid") and result.get("rank") is not None:
+                self._update_best_rank(result["rank"])
 
-        return result
+        return results
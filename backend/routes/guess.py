@@ -1,30 +1,54 @@
 from typing import Any, Dict
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import ORJSONResponse
 
+from backend import cache
 from backend.dependencies import get_engine
 from backend.game import WordGameEngine
-from backend.schemas import GuessRequest, GuessResponse
+from backend.schemas import (
+    GuessBatchRequest,
+    GuessBatchResponse,
+    GuessRequest,
+    GuessResponse,
+)
 
 router = APIRouter()
 
 
 @router.post("/guess", response_model=GuessResponse)
-def make_guess_endpoint(
+async def make_guess_endpoint(
     payload: GuessRequest,
     engine: WordGameEngine = Depends(get_engine),
-) -> GuessResponse:
+) -> ORJSONResponse:
+    # Shared across workers when Redis is configured; no-op otherwise.
+    key = cache.guess_key(engine.target_word, payload.word)
+    cached = await cache.get_json(key)
+    if cached is not None:
+        # A cache hit still counts toward hint state; otherwise cached
+        # guesses would stop influencing best rank and hint strength.
+        engine.record_result(cached)
+        return ORJSONResponse(cached)
+
     result: Dict[str, Any] = engine.make_guess(payload.word)
-    return GuessResponse(
-        **{
-            "guess": result.get("guess", ""),
-            "valid": bool(result.get("valid", False)),
-            "error": result.get("error"),
-            "is_correct": result.get("is_correct"),
-            "rank": result.get("rank"),
-            "total": result.get("total"),
-            "similarity": result.get("similarity"),
-            "percentile": result.get("percentile"),
-            "hotness": result.get("hotness"),
-        }
+    await cache.set_json(key, result)
+    # The engine already produces the response shape (response_model
+    # documents it), so serialize the dict directly instead of paying
+    # for a model instantiation plus validation per request.
+    return ORJSONResponse(result)
+
+
+@router.post("/guess/batch", response_model=GuessBatchResponse)
+async def make_guess_batch_endpoint(
+    payload: GuessBatchRequest,
+    engine: WordGameEngine = Depends(get_engine),
+) -> GuessBatchResponse:
+    """
+    Score several guesses in one request, amortizing HTTP and
+    serialization overhead across the batch.
+    """
+    results = engine.make_guesses(payload.words)
+    # Engine output is already the response shape; skip re-validation.
+    return GuessBatchResponse.model_construct(
+        results=[GuessResponse.model_construct(**result) for result in results]
     )
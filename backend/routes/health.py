@@ -6,9 +6,9 @@ router = APIRouter()
 
 
 @router.get("/health", response_model=HealthResponse)
-def health(request: Request) -> HealthResponse:
+async def health(request: Request) -> HealthResponse:
     engine = getattr(request.app.state, "engine", None)
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="ok" if engine is not None else "degraded",
         target_word_loaded=engine is not None,
     )
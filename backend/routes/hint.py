@@ -8,7 +8,7 @@ router = APIRouter()
 
 
 @router.get("/hint", response_model=HintResponse)
-def hint_endpoint(
+async def hint_endpoint(
     engine: WordGameEngine = Depends(get_engine),
 ) -> HintResponse:
     """
@@ -16,4 +16,5 @@ def hint_endpoint(
     to the current target.
     """
     info = engine.get_hint()
-    return HintResponse(**info)
\ No newline at end of file
+    # Engine output is already the response shape; skip re-validation.
+    return HintResponse.model_construct(**info)
\ No newline at end of file
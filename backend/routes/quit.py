@@ -8,7 +8,7 @@ router = APIRouter()
 
 
 @router.post("/quit", response_model=QuitResponse)
-def quit_endpoint(
+async def quit_endpoint(
     engine: WordGameEngine = Depends(get_engine),
 ) -> QuitResponse:
     """
@@ -16,4 +16,4 @@ def quit_endpoint(
     (Does not reset the game by itself.)
     """
     answer = engine.get_answer()
-    return QuitResponse(answer=answer)
+    return QuitResponse.model_construct(answer=answer)
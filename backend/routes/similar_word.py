@@ -8,7 +8,7 @@ router = APIRouter()
 
 
 @router.get("/similar_word", response_model=SimilarWordResponse)
-def similar_word_endpoint(
+async def similar_word_endpoint(
     engine: WordGameEngine = Depends(get_engine),
 ) -> SimilarWordResponse:
     """
@@ -16,4 +16,5 @@ def similar_word_endpoint(
     to the current target.
     """
     info = engine.get_similar_word()
-    return SimilarWordResponse(**info)
\ No newline at end of file
+    # Engine output is already the response shape; skip re-validation.
+    return SimilarWordResponse.model_construct(**info)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +8,10 @@ class GuessRequest(BaseModel):
     word: str
 
 
+class GuessBatchRequest(BaseModel):
+    words: List[str]
+
+
 class GuessResponse(BaseModel):
     guess: str
     valid: bool
@@ -20,6 +24,10 @@ class GuessResponse(BaseModel):
     hotness: Optional[str] = None
 
 
+class GuessBatchResponse(BaseModel):
+    results: List[GuessResponse]
+
+
 class HealthResponse(BaseModel):
     status: str
     target_word_loaded: bool
@@ -19,16 +19,17 @@ from pathlib import Path
 
 import numpy as np
 
+from backend.utils.vectors import load_embeddings
+
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
 EMB_PATH = "data/embeddings.npz"
 OUT_PATH = "data/similarity.txt"
 
-
-def normalize_rows(x: np.ndarray) -> np.ndarray:
-    norms = np.linalg.norm(x, axis=1, keepdims=True)
-    norms[norms == 0] = 1.0
-    return x / norms
+# Rows of the similarity matrix computed and written per step. Blocking
+# keeps peak memory at BLOCK x N instead of N x N (which stops fitting
+# in RAM well before 100k words) and each block streams straight to disk.
+BLOCK = 2048
 
 
 def main():
@@ -36,23 +37,37 @@ def main():
         logging.error(f"Embeddings file not found: {EMB_PATH}")
         sys.exit(1)
 
-    data = np.load(EMB_PATH, allow_pickle=True)
-    words = data["words"].tolist()
-    emb = data["embeddings"].astype(np.float32)
+    # Rows come back L2-normalized, so cosine similarity is one dot product.
+    words, emb = load_embeddings(EMB_PATH)
 
     logging.info(f"Computing similarities for {len(words)} words...")
 
-    emb = normalize_rows(emb)
-    sim = np.matmul(emb, emb.T)
-    np.clip(sim, -1.0, 1.0, out=sim)
+    words_arr = np.array(words, dtype=object)
 
     with open(OUT_PATH, "w", encoding="utf-8") as fh:
-        for i, w in enumerate(words):
-            row = sim[i].copy()
-            row[i] = -2.0  # exclude itself
-            idx = np.argsort(-row)
-            pairs = [f"{words[j]}:{sim[i][j]:.6f}" for j in idx]
-            fh.write(f"{w}\t{','.join(pairs)}\n")
+        for i0 in range(0, len(words), BLOCK):
+            sim = emb[i0 : i0 + BLOCK] @ emb.T
+            np.clip(sim, -1.0, 1.0, out=sim)
+
+            # Sort the block's rows in one batched argsort instead of a
+            # Python loop of per-row sorts. Sinking each word's own score
+            # below any real value makes it sort last in its row, so
+            # trimming the final column excludes self without row copies.
+            rows = np.arange(sim.shape[0])
+            sim[rows, i0 + rows] = -2.0
+            order = np.argsort(-sim, axis=1)[:, :-1]
+            sorted_sim = np.take_along_axis(sim, order, axis=1)
+
+            # Format all scores in C via np.char.mod, then glue
+            # word:score cells with array ops; Python only joins one
+            # string per row.
+            cells = (
+                words_arr[order]
+                + ":"
+                + np.char.mod("%.6f", sorted_sim).astype(object)
+            )
+            for w, row_cells in zip(words[i0 : i0 + BLOCK], cells):
+                fh.write(f"{w}\t{','.join(row_cells)}\n")
 
     logging.info(f"Saved similarity data to {OUT_PATH}")
 
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+build_similarity_bin.py
+
+One-time conversion of data/similarity.txt into a binary format:
+
+  - similarity.bin        fixed-width (uint16 word_id, int8 score)
+                          records, rows concatenated back-to-back
+  - similarity_index.npz  words (id -> word), starts, counts per row
+
+The engine memory-maps similarity.bin and slices rows directly, so
+startup and set_target skip ASCII float parsing entirely.
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+import numpy as np
+
+from backend.config import (
+    SIMILARITY_BIN_PATH,
+    SIMILARITY_INDEX_PATH,
+    SIMILARITY_PATH,
+)
+from backend.utils.loaders import (
+    SIM_BIN_DTYPE,
+    SIM_SCORE_SCALE,
+    build_line_index,
+    read_similarity_row,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+
+def main():
+    if not Path(SIMILARITY_PATH).exists():
+        logging.error(f"Similarity file not found: {SIMILARITY_PATH}")
+        sys.exit(1)
+
+    offsets = build_line_index(str(SIMILARITY_PATH))
+    words = list(offsets.keys())
+    if len(words) > 0xFFFF:
+        logging.error(
+            f"{len(words)} rows exceed the uint16 id space of the binary "
+            "format; widen SIM_BIN_DTYPE before converting."
+        )
+        sys.exit(1)
+    word2id = {w: i for i, w in enumerate(words)}
+    logging.info(f"Converting {len(words)} rows to binary...")
+
+    starts = np.empty(len(words), dtype=np.int64)
+    counts = np.empty(len(words), dtype=np.int64)
+
+    pos = 0
+    with open(SIMILARITY_BIN_PATH, "wb") as out:
+        for i, w in enumerate(words):
+            neighbors, scores = read_similarity_row(
+                str(SIMILARITY_PATH), offsets[w]
+            )
+            # Neighbors without a row of their own can't be guessed
+            # against this format, so drop them (none exist in practice).
+            pairs = [
+                (word2id[o], int(round(max(-1.0, min(1.0, s)) * SIM_SCORE_SCALE)))
+                for o, s in zip(neighbors, scores)
+                if o in word2id
+            ]
+            row = np.array(pairs, dtype=SIM_BIN_DTYPE)
+            row.tofile(out)
+            starts[i] = pos
+            counts[i] = len(row)
+            pos += len(row)
+
+    np.savez(
+        SIMILARITY_INDEX_PATH,
+        words=np.array(words, dtype=object),
+        starts=starts,
+        counts=counts,
+    )
+    logging.info(
+        f"Wrote {pos} records to {SIMILARITY_BIN_PATH} and index to "
+        f"{SIMILARITY_INDEX_PATH}"
+    )
+
+
+if __name__ == "__main__":
+    main()
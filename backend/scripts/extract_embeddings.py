@@ -12,6 +12,9 @@ Outputs:
 """
 
 import logging
+import mmap
+import multiprocessing
+import os
 import sys
 from pathlib import Path
 
@@ -38,6 +41,55 @@ def read_nouns(path: str):
     return nouns
 
 
+def _chunk_ranges(path: str, nprocs: int):
+    """
+    Split the file into up to nprocs byte ranges, each starting on a
+    line boundary, so workers can scan disjoint regions independently.
+    """
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as fh:
+        for k in range(1, nprocs):
+            fh.seek(size * k // nprocs)
+            fh.readline()  # advance to the next line start
+            bounds.append(min(fh.tell(), size))
+    bounds.append(size)
+    return [(s, e) for s, e in zip(bounds, bounds[1:]) if s < e]
+
+
+def _scan_range(path: str, start: int, end: int, noun_keys):
+    """
+    Scan one byte range of GloVe for wanted tokens. Each worker maps
+    the same file, so the page cache is shared and nothing is copied.
+    """
+    found = {}
+    with open(path, "rb") as gh:
+        mm = mmap.mmap(gh.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            pos = start
+            while pos < end:
+                nl = mm.find(b"\n", pos)
+                line_end = end if nl < 0 else nl
+                sp = mm.find(b" ", pos, line_end)
+                if sp > pos:
+                    key = mm[pos:sp].lower()
+                    if key in noun_keys:
+                        try:
+                            vec = np.array(
+                                mm[sp + 1 : line_end].split(), dtype=np.float32
+                            )
+                        except ValueError:
+                            vec = np.empty(0)  # malformed floats, skip
+
+                        token = key.decode("utf-8")
+                        if vec.shape[0] == 300 and token not in found:
+                            found[token] = vec
+                pos = line_end + 1
+        finally:
+            mm.close()
+    return found
+
+
 def extract():
     # File existence checks
     if not Path(GLOVE_PATH).exists():
@@ -58,30 +110,32 @@ def extract():
     nouns_set = set(nouns)
     logging.info(f"Looking for {len(nouns_set)} nouns in GloVe...")
 
+    # Nearly every GloVe line is for a word we don't want, so the scan
+    # is structured around a cheap reject path: mmap the file and walk
+    # newline-to-newline, comparing only the leading token (as bytes,
+    # against byte-encoded nouns) before any decoding or float parsing.
+    # The scan is CPU-bound, so it is split across one worker per core.
+    noun_keys = frozenset(w.encode("utf-8") for w in nouns_set)
+
+    nprocs = min(os.cpu_count() or 1, 8)
+    ranges = _chunk_ranges(GLOVE_PATH, nprocs)
+    if len(ranges) > 1:
+        logging.info(f"Scanning GloVe with {len(ranges)} workers...")
+        with multiprocessing.Pool(len(ranges)) as pool:
+            parts = pool.starmap(
+                _scan_range,
+                [(GLOVE_PATH, s, e, noun_keys) for s, e in ranges],
+            )
+    else:
+        parts = [_scan_range(GLOVE_PATH, s, e, noun_keys) for s, e in ranges]
+
+    # Merge in file order so the first occurrence of a token wins, as
+    # the single-pass scan did.
     found_vectors = {}
-    found_count = 0
-
-    # Read GloVe and grab only relevant words
-    with open(GLOVE_PATH, "r", encoding="utf-8") as gh:
-        for line in gh:
-            parts = line.rstrip().split(" ")
-            if len(parts) < 301:
-                continue  # malformed line
-
-            token = parts[0].lower()
-            if token in nouns_set:
-                try:
-                    vec = np.asarray(parts[1:], dtype=np.float32)
-                except ValueError:
-                    # if any float conversion fails, skip this line
-                    continue
-
-                if vec.shape[0] == 300:
-                    if token not in found_vectors:  # avoid overwriting
-                        found_vectors[token] = vec
-                        found_count += 1
-                        if found_count % 100 == 0:
-                            logging.info(f"Found {found_count}/{len(nouns_set)}")
+    for part in parts:
+        for token, vec in part.items():
+            found_vectors.setdefault(token, vec)
+    logging.info(f"Found {len(found_vectors)}/{len(nouns_set)}")
 
     # Identify missing nouns
     missing = [w for w in nouns if w not in found_vectors]
@@ -103,7 +157,11 @@ def extract():
         )
         sys.exit(1)
 
-    embedding_matrix = np.vstack([found_vectors[w] for w in valid_words])
+    # One allocation filled row-by-row: vstack would route the same
+    # copies through a temporary Python list of the whole matrix.
+    embedding_matrix = np.empty((len(valid_words), 300), dtype=np.float32)
+    for i, w in enumerate(valid_words):
+        embedding_matrix[i] = found_vectors[w]
 
     logging.info(f"Saving {len(valid_words)} embeddings to {OUT_PATH}")
     np.savez_compressed(
@@ -1,10 +1,16 @@
+import pytest
 from fastapi.testclient import TestClient
 
 from backend.api import app
 
-client = TestClient(app)
 
-def test_read_root():
+@pytest.fixture(scope="module")
+def client():
+    # Context manager runs the lifespan handler so the engine is loaded.
+    with TestClient(app) as c:
+        yield c
+
+def test_read_root(client):
     response = client.get("/")
     assert response.status_code == 200
     assert response.json() == {
@@ -12,24 +18,33 @@ def test_read_root():
         "endpoints": ["/health", "/guess", "/similar_word", "/quit", "/docs"],
     }
 
-def test_health_check():
+def test_health_check(client):
     response = client.get("/health")
     assert response.status_code == 200
     data = response.json()
     assert data["status"] in ["ok", "degraded"]
     assert "target_word_loaded" in data
 
-def test_make_guess_invalid():
+def test_make_guess_invalid(client):
     response = client.post("/guess", json={"word": ""})
     assert response.status_code == 200
     data = response.json()
     assert data["valid"] is False
     assert data["error"] == "Empty guess."
 
-def test_make_guess_valid():
+def test_make_guess_valid(client):
     # Assuming "dog" is in the vocabulary
     response = client.post("/guess", json={"word": "dog"})
     assert response.status_code == 200
     data = response.json()
     assert data["valid"] is True
     assert "rank" in data
+
+def test_make_guess_batch(client):
+    response = client.post("/guess/batch", json={"words": ["dog", "cat", ""]})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 3
+    assert results[0]["valid"] is True
+    assert results[2]["valid"] is False
+    assert results[2]["error"] == "Empty guess."
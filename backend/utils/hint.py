@@ -1,8 +1,51 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 import random
 
 from backend.schemas import HintStrength
 
+# Module-local RNG so hint picks don't contend on the random module's
+# shared instance under concurrent requests.
+_rng = random.Random()
+
+
+def _clamp_window(low_rank: int, high_rank: int, n_others: int) -> Tuple[int, int]:
+    # Clamp to valid range [1, n_others]
+    low_rank = max(1, min(low_rank, n_others))
+    high_rank = max(1, min(high_rank, n_others))
+
+    # If the window has collapsed (low > high), fall back to top 20
+    if low_rank > high_rank:
+        low_rank = 1
+        high_rank = min(20, n_others)
+
+    return low_rank, high_rank
+
+
+@lru_cache(maxsize=256)
+def _static_window(n_others: int, hint_strength: HintStrength) -> Tuple[int, int]:
+    """
+    Fixed rank band used while the player has no meaningful best rank.
+    Pure function of (n_others, strength) — and n_others is fixed per
+    target — so the clamping arithmetic runs once per (row size,
+    strength) and every later hint is a cache hit.
+    """
+    # For strong hints: give something in 1–50 (or up to n_others).
+    # For soft hints: 50–100, if possible.
+    if hint_strength == "strong":
+        low_rank = 1
+        high_rank = min(50, n_others)
+    else:  # "soft"
+        low_rank = 50
+        high_rank = 100
+        if low_rank > n_others:  # too small vocab, fall back
+            low_rank = 1
+            high_rank = min(20, n_others)
+        else:
+            high_rank = min(high_rank, n_others)
+    return _clamp_window(low_rank, high_rank, n_others)
+
+
 def _choose_hint_index(
     n_others: int,
     best_rank_overall: Optional[int],
@@ -23,23 +66,11 @@ def _choose_hint_index(
     """
     # No good info yet or user is still far (wild guesses)
     if best_rank_overall is None or best_rank_overall > 100:
-        # Use fixed bands in terms of rank.
-        # For strong hints: give something in 1–50 (or up to n_others).
-        # For soft hints: 50–100, if possible.
-        if hint_strength == "strong":
-            low_rank = 1
-            high_rank = min(50, n_others)
-        else:  # "soft"
-            low_rank = 50
-            high_rank = 100
-            if low_rank > n_others:  # too small vocab, fall back
-                low_rank = 1
-                high_rank = min(20, n_others)
-            else:
-                high_rank = min(high_rank, n_others)
+        low_rank, high_rank = _static_window(n_others, hint_strength)
     else:
         # We already have a reasonably good rank (<= 100).
-        # Always try to suggest a STRICTLY better rank.
+        # Always try to suggest a STRICTLY better rank. This window
+        # depends on the exact best rank, so it stays computed per call.
         best = min(best_rank_overall, n_others)  # safety clamp
 
         if best <= 1:
@@ -59,14 +90,7 @@ def _choose_hint_index(
                 low_rank = max(1, best - improvement_window)
                 high_rank = best - 1
 
-    # Clamp to valid range [1, n_others]
-    low_rank = max(1, min(low_rank, n_others))
-    high_rank = max(1, min(high_rank, n_others))
-
-    # If the window has collapsed (low > high), fall back to top 20
-    if low_rank > high_rank:
-        low_rank = 1
-        high_rank = min(20, n_others)
+        low_rank, high_rank = _clamp_window(low_rank, high_rank, n_others)
 
     # Convert to 0-based index
-    return random.randint(low_rank - 1, high_rank - 1)
+    return _rng.randint(low_rank - 1, high_rank - 1)
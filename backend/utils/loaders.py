@@ -1,51 +1,210 @@
+import mmap
+import pickle
+import sys
+from pathlib import Path
 from typing import Dict, List, Tuple
 
+import numpy as np
+
+# One record per (neighbor, score) pair in the binary similarity file.
+# Scores are cosine values in [-1, 1] used only for display and hotness
+# bucketing, so they are stored quantized to int8 (score * 127) — a
+# quarter of the float32 bytes, same ordering. Word ids are uint16
+# (the vocabulary is far below 65k; the build script enforces this),
+# making each record 3 bytes instead of the original 8.
+SIM_BIN_DTYPE = np.dtype([("id", "<u2"), ("score", "<i1")])
+SIM_SCORE_SCALE = 127.0
+
 
 def load_vocab(path: str) -> List[str]:
+    # Parsed vocab is cached as a pickle next to the source, guarded by
+    # mtime, so repeated worker startups skip the tokenize/lower pass.
+    # Cache misses or unwritable directories just fall back to parsing.
+    src = Path(path)
+    cache = src.with_suffix(".pkl")
+    try:
+        if cache.stat().st_mtime >= src.stat().st_mtime:
+            with open(cache, "rb") as fh:
+                return pickle.load(fh)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
     with open(path, "r", encoding="utf-8") as fh:
         text = fh.read()
     tokens = text.split()
-    return [t.strip().lower() for t in tokens if t.strip()]
+    vocab = [t.strip().lower() for t in tokens if t.strip()]
+
+    try:
+        with open(cache, "wb") as fh:
+            pickle.dump(vocab, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return vocab
+
+
+def open_similarity_text(path: str) -> mmap.mmap:
+    """
+    Memory-map the text similarity file read-only. The mapping shares the
+    kernel page cache across processes and restarts, and row reads become
+    byte slices instead of buffered readline() calls.
+    """
+    with open(path, "rb") as fh:
+        return mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
 
 
 def build_line_index(path: str) -> Dict[str, int]:
+    mm = open_similarity_text(path)
+    try:
+        return build_line_index_mm(mm)
+    finally:
+        mm.close()
+
+
+def build_line_index_mm(mm: mmap.mmap) -> Dict[str, int]:
+    """
+    Build the word -> byte-offset index by scanning the mapped file for
+    newlines. Only each line's head (up to the tab) is decoded; the bulk
+    of the file — the neighbor lists — is never touched here.
+    """
     offsets: Dict[str, int] = {}
-    with open(path, "r", encoding="utf-8") as fh:
-        while True:
-            pos = fh.tell()
-            line = fh.readline()
-            if not line:
-                break
-            parts = line.split("\t", 1)
-            if not parts:
-                continue
-            word = parts[0].strip()
-            if word:
-                offsets[word] = pos
+    size = mm.size()
+    pos = 0
+    while pos < size:
+        nl = mm.find(b"\n", pos)
+        end = size if nl < 0 else nl
+        tab = mm.find(b"\t", pos, end)
+        word = mm[pos : (end if tab < 0 else tab)].decode("utf-8").strip()
+        if word:
+            # Interned keys make repeated lookups pointer comparisons
+            offsets[sys.intern(word)] = pos
+        pos = end + 1
     return offsets
 
 
-def read_similarity_row(path: str, offset: int) -> List[Tuple[str, float]]:
+def read_similarity_row(path: str, offset: int) -> Tuple[List[str], np.ndarray]:
     with open(path, "r", encoding="utf-8") as fh:
-        fh.seek(offset)
-        line = fh.readline()
+        return read_similarity_row_from(fh, offset)
+
+
+def read_similarity_row_from(fh, offset: int) -> Tuple[List[str], np.ndarray]:
+    """
+    Like read_similarity_row, but on an already-open handle so callers
+    reading many rows don't pay open/close syscalls per row.
+    """
+    fh.seek(offset)
+    line = fh.readline()
     if not line:
         raise ValueError("Failed to read line at offset")
+    return _parse_row_line(line)
+
+
+def read_similarity_row_mm(mm: mmap.mmap, offset: int) -> Tuple[List[str], np.ndarray]:
+    """
+    Read one row from the mapped text file: slice the bytes between the
+    offset and the next newline, decode just that slice, and parse it.
+    """
+    nl = mm.find(b"\n", offset)
+    end = mm.size() if nl < 0 else nl
+    if end <= offset:
+        raise ValueError("Failed to read line at offset")
+    return _parse_row_line(mm[offset:end].decode("utf-8"))
+
 
+def _parse_row_line(line: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Parse one "word<TAB>other:score,..." line into parallel
+    (words, scores) columns. Splitting the columns apart lets one
+    np.array call parse every score in C instead of a float() per pair.
+    """
     parts = line.rstrip("\n").split("\t", 1)
-    if len(parts) != 2:
-        return []
-
-    right = parts[1]
-    if not right:
-        return []
-
-    pairs = right.split(",")
-    result: List[Tuple[str, float]] = []
-    for p in pairs:
-        try:
-            other, sc = p.rsplit(":", 1)
-            result.append((other, float(sc)))
-        except ValueError:
+    if len(parts) != 2 or not parts[1]:
+        return [], np.empty(0, dtype=np.float32)
+
+    words: List[str] = []
+    score_strs: List[str] = []
+    for entry in parts[1].split(","):
+        i = entry.rfind(":")
+        if i < 0:
             continue
-    return result
+        # Neighbor words recur across rows; intern so every parsed
+        # row references the one shared str per vocab word.
+        words.append(sys.intern(entry[:i]))
+        score_strs.append(entry[i + 1 :])
+
+    try:
+        scores = np.array(score_strs, dtype=np.float32)
+    except ValueError:
+        # A malformed score: reparse entry-by-entry, dropping bad pairs.
+        kept_words: List[str] = []
+        kept_scores: List[float] = []
+        for w, s in zip(words, score_strs):
+            try:
+                kept_scores.append(float(s))
+            except ValueError:
+                continue
+            kept_words.append(w)
+        words = kept_words
+        scores = np.asarray(kept_scores, dtype=np.float32)
+
+    return words, scores
+
+
+def load_similarity_index(path: str) -> Tuple[np.ndarray, Dict[str, Tuple[int, int]]]:
+    """
+    Load the sidecar index of the binary similarity file.
+
+    Returns (id2word, row_index) where id2word maps word id -> word and
+    row_index maps word -> (start record, record count) in similarity.bin.
+    """
+    data = np.load(path, allow_pickle=True)
+    # Object array of interned strings: every row materialized from ids
+    # then shares the single vocab str object per word instead of
+    # allocating fresh unicode copies.
+    id2word = np.array(
+        [sys.intern(str(w)) for w in data["words"]], dtype=object
+    )
+    starts = data["starts"]
+    counts = data["counts"]
+    row_index = {
+        sys.intern(str(w)): (int(s), int(c))
+        for w, s, c in zip(id2word, starts, counts)
+    }
+    return id2word, row_index
+
+
+def open_similarity_bin(path: str) -> np.ndarray:
+    """
+    Memory-map the binary similarity file. Rows are slices of fixed-width
+    (id, score) records — no parsing, no per-row allocation beyond a view.
+
+    Access is row-at-an-offset, so the mapping is advised MADV_RANDOM to
+    stop the kernel reading ahead into rows that will never be touched;
+    advise_row_willneed prefetches the one row that will be.
+    """
+    with open(path, "rb") as fh:
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    if hasattr(mmap, "MADV_RANDOM"):
+        mm.madvise(mmap.MADV_RANDOM)
+    # frombuffer keeps mm alive as the array's .base
+    return np.frombuffer(mm, dtype=SIM_BIN_DTYPE)
+
+
+def advise_row_willneed(records: np.ndarray, start: int, count: int) -> None:
+    """
+    Hint the kernel to asynchronously fault in the pages backing
+    records[start:start+count] before they are touched. No-op when the
+    array isn't mmap-backed or the platform lacks madvise.
+    """
+    mm = records.base
+    if isinstance(mm, memoryview):  # frombuffer wraps the mmap in one
+        mm = mm.obj
+    if not isinstance(mm, mmap.mmap) or not hasattr(mmap, "MADV_WILLNEED"):
+        return
+    itemsize = records.dtype.itemsize
+    offset = start * itemsize
+    end = min(offset + count * itemsize, records.nbytes)
+    aligned = offset - (offset % mmap.PAGESIZE)
+    try:
+        mm.madvise(mmap.MADV_WILLNEED, aligned, end - aligned)
+    except (OSError, ValueError):
+        pass
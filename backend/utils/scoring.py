@@ -1,7 +1,27 @@
 # scoring.py — Updated percentile-based hotness
 
+import sys
 from typing import Optional
 
+import numpy as np
+
+# Percentile band lower bounds, coldest band first; must stay aligned
+# with the cascade in describe_hotness below. Labels are interned so
+# every response dict carries the same str object per band.
+_HOTNESS_THRESHOLDS = np.array(
+    [25.0, 50.0, 75.0, 90.0, 95.0, 99.0], dtype=np.float32
+)
+_HOTNESS_LABELS = np.array(
+    [
+        sys.intern(label)
+        for label in (
+            "Freezing", "Cold", "Cool", "Warm", "Hot", "Very hot", "Boiling"
+        )
+    ],
+    dtype=object,
+)
+
+
 def compute_percentile(rank: int, total: int) -> float:
     """
     Convert rank into a percentile where:
@@ -34,3 +54,18 @@ def describe_hotness(rank: int, total: int) -> str:
     if percentile >= 25.0:
         return "Cold"
     return "Freezing"
+
+
+def describe_hotness_batch(ranks: np.ndarray, total: int) -> np.ndarray:
+    """
+    Vectorized describe_hotness for an array of ranks: one searchsorted
+    call classifies every element, with no per-rank Python dispatch.
+    """
+    ranks = np.asarray(ranks)
+    total_others = max(1, total - 1)
+    percentiles = 100.0 * (1.0 - (ranks - 1) / total_others)
+    labels = _HOTNESS_LABELS[
+        np.searchsorted(_HOTNESS_THRESHOLDS, percentiles, side="right")
+    ]
+    labels[ranks == 1] = "Correct"
+    return labels
@@ -0,0 +1,54 @@
+"""
+Vector helpers for the similarity pipeline.
+
+Embeddings are L2-normalized once at load time so that cosine similarity
+reduces to a plain dot product, which BLAS executes as a single
+vectorized (SIMD) operation instead of a per-pair Python loop.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+def normalize_rows(x: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row of x. Zero rows are left unchanged, and
+    already-normalized input is returned as-is instead of copied.
+    """
+    norms = np.linalg.norm(x, axis=1, keepdims=True)
+    if np.allclose(norms, 1.0, atol=1e-5):
+        return x
+    norms[norms == 0] = 1.0
+    return x / norms
+
+
+def load_embeddings(path: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Load an embeddings .npz (words + embeddings) and return the words
+    plus a row-normalized float32 matrix.
+    """
+    data = np.load(path, allow_pickle=True)
+    words = data["words"].tolist()
+    emb = normalize_rows(data["embeddings"].astype(np.float32))
+    return words, emb
+
+
+def similarity_row(vecs: np.ndarray, idx: int) -> np.ndarray:
+    """
+    Cosine similarity of every row against row idx. Since rows are
+    normalized, this is a single matrix-vector dot product.
+    """
+    return vecs @ vecs[idx]
+
+
+def top_n_indices(sims: np.ndarray, n: int) -> np.ndarray:
+    """
+    Indices of the n most similar entries, most similar first.
+
+    argpartition selects the top n in O(V) and only that slice gets
+    sorted, instead of a full O(V log V) argsort of the whole vector.
+    """
+    n = min(n, len(sims))
+    top = np.argpartition(sims, -n)[-n:]
+    return top[np.argsort(-sims[top])]
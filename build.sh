@@ -1,4 +1,5 @@
 #!/bin/bash
 set -euxo pipefail
 
-pip install -r requirements.txt
\ No newline at end of file
+pip install -r requirements.txt
+python -m backend.scripts.build_similarity_bin
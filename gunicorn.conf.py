@@ -0,0 +1,15 @@
+import multiprocessing
+
+# Async uvicorn workers behind gunicorn's process manager, sized to the
+# usual 2*cores+1 rule for a read-mostly service.
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Import the app once in the master so code and module-level data are
+# shared copy-on-write across workers. The similarity data itself is
+# mmap'd, so it is shared through the page cache either way.
+preload_app = True
+
+# Recycle workers periodically to keep any slow heap growth bounded.
+max_requests = 10000
+max_requests_jitter = 1000
@@ -1,2 +1,2 @@
 #!/bin/bash
-uvicorn backend.api:app --host 0.0.0.0 --port $PORT
\ No newline at end of file
+gunicorn backend.api:app -c gunicorn.conf.py --bind 0.0.0.0:$PORT